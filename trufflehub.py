@@ -8,17 +8,42 @@ import signal
 import subprocess
 import sys
 import termios
+import threading
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
 
 GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
 TEMP_DIRS = []
-INTERRUPTED = False
+INTERRUPTED = threading.Event()
 SILENT_MODE = False
 START_TIME = None
 OLD_TERM_SETTINGS = None
+PROCESS_LOCK = threading.Lock()
+RUNNING_PROCESSES = set()
+OUTPUT_LOCK = threading.RLock()
+OUTPUT_BUFFER = bytearray()
+OUTPUT_BUFFER_SIZE = 4096
+STDOUT_IS_TTY = sys.stdout.isatty()
+SCANNED_COUNT = 0
+PROGRESS_TMPL = "[%d]"
 
 class Colors:
     RED = '\033[91m'
@@ -32,6 +57,17 @@ class Colors:
     MAGENTA = '\033[95m'
     GREEN = '\033[92m'
 
+COUNT_CRITICAL_TMPL = f"[{Colors.RED}%d findings{Colors.RESET}]"
+COUNT_MEDIUM_TMPL = f"[{Colors.ORANGE}%d findings{Colors.RESET}]"
+
+BADGE_FAILED = f"[{Colors.RED}failed{Colors.RESET}]"
+BADGE_UNKNOWN = f"[{Colors.DIM}unknown{Colors.RESET}]"
+BADGE_PRIVATE = f"[{Colors.MAGENTA}private{Colors.RESET}]"
+BADGE_FORK = f"[{Colors.YELLOW}fork{Colors.RESET}]"
+BADGE_ORIGIN = f"[{Colors.GREEN}origin{Colors.RESET}]"
+BADGE_ARCHIVED = f"[{Colors.BLUE}archived{Colors.RESET}]"
+BADGE_DISABLED = f"[{Colors.RED}disabled{Colors.RESET}]"
+
 IGNORED_PATTERNS = [
     r'example',
     r'demo',
@@ -50,50 +86,123 @@ IGNORED_PATTERNS = [
     r'dummy'
 ]
 
+IGNORED_RE = re.compile("|".join(IGNORED_PATTERNS), re.IGNORECASE)
+
+def build_ignored_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for pattern in IGNORED_PATTERNS:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+IGNORED_AUTOMATON = build_ignored_automaton()
+
+def matches_ignored(text: str) -> bool:
+    if IGNORED_AUTOMATON is None:
+        return bool(IGNORED_RE.search(text))
+    for _ in IGNORED_AUTOMATON.iter(text.lower()):
+        return True
+    return False
+
 REPO_METADATA_CACHE = {}
 
+GRAPHQL_URL = "https://api.github.com/graphql"
+GRAPHQL_BATCH_SIZE = 100
+PAGE_SIZE = 100
+PAGE_WORKERS = 16
+MEMBER_WORKERS = 10
+API_CONCURRENCY = 10
+API_SEMAPHORE = threading.BoundedSemaphore(API_CONCURRENCY)
+LISTING_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "trufflehub", "listing.json")
+LISTING_FIELDS = ("clone_url", "fork", "private", "archived", "disabled", "login")
+LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)>; rel="last"')
+
 def should_label_as_medium(finding_data: Dict) -> bool:
     try:
         source_metadata = finding_data.get("SourceMetadata", {})
         data = source_metadata.get("Data", {})
         git_data = data.get("Git", {})
 
-        file_path = git_data.get("file", "").lower()
-        repository = git_data.get("repository", "").lower()
+        file_path = git_data.get("file", "")
 
-        combined_text = f"{file_path} {repository}"
-
-        for pattern in IGNORED_PATTERNS:
-            if re.search(pattern, combined_text, re.IGNORECASE):
-                return True
-
-        return False
-    except:
+        return bool(file_path) and matches_ignored(file_path)
+    except Exception:
         return False
 
+def flush_output():
+    with OUTPUT_LOCK:
+        if not OUTPUT_BUFFER:
+            return
+        sys.stdout.flush()
+        view = memoryview(OUTPUT_BUFFER)
+        while view:
+            view = view[os.write(sys.stdout.fileno(), view):]
+        view.release()
+        OUTPUT_BUFFER.clear()
+
+def emit(text: str):
+    with OUTPUT_LOCK:
+        OUTPUT_BUFFER.extend(text.encode() + b"\n")
+        if STDOUT_IS_TTY or len(OUTPUT_BUFFER) > OUTPUT_BUFFER_SIZE:
+            flush_output()
+
+def start_process(cmd: List[str]) -> Optional[subprocess.Popen]:
+    with PROCESS_LOCK:
+        if INTERRUPTED.is_set():
+            return None
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, start_new_session=True)
+        RUNNING_PROCESSES.add(proc)
+        return proc
+
+def finish_process(proc: subprocess.Popen):
+    with PROCESS_LOCK:
+        RUNNING_PROCESSES.discard(proc)
+
+def terminate_processes():
+    with PROCESS_LOCK:
+        for proc in RUNNING_PROCESSES:
+            try:
+                os.killpg(proc.pid, signal.SIGTERM)
+            except Exception:
+                pass
+
 def cleanup():
     global OLD_TERM_SETTINGS
+    terminate_processes()
+    flush_output()
     for temp_dir in TEMP_DIRS:
         if os.path.exists(temp_dir):
             try:
                 shutil.rmtree(temp_dir)
-            except:
+            except Exception:
                 pass
     if OLD_TERM_SETTINGS is not None:
         try:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, OLD_TERM_SETTINGS)
-        except:
+        except Exception:
             pass
 
 def signal_handler(signum, frame):
-    global INTERRUPTED, START_TIME
-    INTERRUPTED = True
+    INTERRUPTED.set()
+    raise KeyboardInterrupt
+
+def handle_interrupt():
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    INTERRUPTED.set()
+    terminate_processes()
+    flush_output()
     print(f"[{Colors.YELLOW}WRN{Colors.RESET}] Scan interrupted by user")
     print(f"[{Colors.YELLOW}WRN{Colors.RESET}] Cleaning up temporary files...")
     cleanup()
+    save_listing_cache()
     elapsed_time = (time.time() - START_TIME) if START_TIME is not None else 0
     print(f"\n[{Colors.CYAN}INF{Colors.RESET}] Scan finished {Colors.DIM}({elapsed_time:.3f}s time elapsed){Colors.RESET}")
-    sys.exit(130)
+    sys.stdout.flush()
+    # Skip interpreter shutdown: it would join pool threads still blocked on in-flight requests.
+    os._exit(130)
 
 signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
@@ -120,27 +229,82 @@ def get_headers():
         headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
     return headers
 
-def run_command(cmd: List[str]) -> Dict:
+def create_session() -> requests.Session:
+    session = requests.Session()
+    retries = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retries)
+    session.mount("https://", adapter)
+    session.headers.update(get_headers())
+    return session
+
+SESSION = create_session()
+
+def api_request(method: str, url: str, **kwargs) -> requests.Response:
+    with API_SEMAPHORE:
+        return SESSION.request(method, url, **kwargs)
+
+def load_listing_cache() -> Dict:
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return {"success": True, "output": result.stdout, "error": ""}
-    except subprocess.CalledProcessError as e:
-        return {"success": False, "output": "", "error": e.stderr}
+        with open(LISTING_CACHE_PATH) as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def save_listing_cache():
+    try:
+        os.makedirs(os.path.dirname(LISTING_CACHE_PATH), exist_ok=True)
+        with open(LISTING_CACHE_PATH, "w") as f:
+            json.dump(dict(LISTING_CACHE), f)
+    except Exception:
+        pass
+
+LISTING_CACHE = load_listing_cache()
+atexit.register(save_listing_cache)
+
+def get_listing_page(url: str) -> Tuple[int, List[Dict], str]:
+    cached = LISTING_CACHE.get(url)
+    headers = {"If-None-Match": cached["etag"]} if cached else None
+
+    response = api_request("GET", url, headers=headers, timeout=15)
+
+    if response.status_code == 304 and cached:
+        link = response.headers.get("Link", cached["link"])
+        cached["link"] = link
+        return 200, cached["data"], link
+    if response.status_code != 200:
+        return response.status_code, [], ""
+
+    data = [
+        {key: item[key] for key in LISTING_FIELDS if key in item}
+        for item in json_loads(response.content)
+    ]
+    link = response.headers.get("Link", "")
+    etag = response.headers.get("ETag")
+    if etag:
+        LISTING_CACHE[url] = {"etag": etag, "link": link, "data": data}
+
+    return 200, data, link
+
+def parse_repo_url(repo_url: str) -> Tuple[str, str]:
+    url = repo_url.rstrip("/")
+    if url.endswith(".git"):
+        url = url[:-4]
+    name_start = url.rfind("/")
+    owner_start = url.rfind("/", 0, name_start)
+    return url[owner_start + 1:name_start], url[name_start + 1:]
 
 def get_repo_metadata(repo_url: str) -> Optional[Dict]:
     if repo_url in REPO_METADATA_CACHE:
         return REPO_METADATA_CACHE[repo_url]
 
     try:
-        parts = repo_url.rstrip("/").replace(".git", "").split("/")
-        owner = parts[-2]
-        repo_name = parts[-1]
+        owner, repo_name = parse_repo_url(repo_url)
 
         url = f"https://api.github.com/repos/{owner}/{repo_name}"
-        response = requests.get(url, headers=get_headers(), timeout=10)
+        response = api_request("GET", url, timeout=15)
 
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             metadata = {
                 "fork": data.get("fork", False),
                 "private": data.get("private", False),
@@ -149,228 +313,276 @@ def get_repo_metadata(repo_url: str) -> Optional[Dict]:
             }
             REPO_METADATA_CACHE[repo_url] = metadata
             return metadata
-    except:
+    except Exception:
         pass
 
     return None
 
-def format_repo_type(metadata: Optional[Dict], failed: bool = False) -> str:
+def prefetch_repo_metadata(repo_urls: List[str]):
+    if not GITHUB_TOKEN:
+        return
+
+    pending = [repo_url for repo_url in repo_urls if repo_url not in REPO_METADATA_CACHE]
+
+    for start in range(0, len(pending), GRAPHQL_BATCH_SIZE):
+        batch = pending[start:start + GRAPHQL_BATCH_SIZE]
+
+        fields = []
+        for i, repo_url in enumerate(batch):
+            owner, repo_name = parse_repo_url(repo_url)
+            fields.append(f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo_name)}) {{ isFork isPrivate isArchived isDisabled }}")
+        query = "query { " + " ".join(fields) + " }"
+
+        try:
+            response = api_request("POST", GRAPHQL_URL, json={"query": query}, timeout=30)
+            if response.status_code != 200:
+                continue
+            data = json_loads(response.content).get("data") or {}
+        except Exception:
+            continue
+
+        for i, repo_url in enumerate(batch):
+            repo = data.get(f"r{i}")
+            if repo:
+                REPO_METADATA_CACHE[repo_url] = {
+                    "fork": repo.get("isFork", False),
+                    "private": repo.get("isPrivate", False),
+                    "archived": repo.get("isArchived", False),
+                    "disabled": repo.get("isDisabled", False)
+                }
+
+@lru_cache(maxsize=None)
+def compose_badges(failed: bool, known: bool, private: bool, fork: bool, archived: bool, disabled: bool) -> str:
     badges = []
 
     if failed:
-        badges.append(f"[{Colors.RED}failed{Colors.RESET}]")
+        badges.append(BADGE_FAILED)
 
-    if metadata is None:
-        badges.append(f"[{Colors.DIM}unknown{Colors.RESET}]")
+    if not known:
+        badges.append(BADGE_UNKNOWN)
         return " ".join(badges)
 
-    if metadata.get("private"):
-        badges.append(f"[{Colors.MAGENTA}private{Colors.RESET}]")
+    if private:
+        badges.append(BADGE_PRIVATE)
 
-    if metadata.get("fork"):
-        badges.append(f"[{Colors.YELLOW}fork{Colors.RESET}]")
-    else:
-        badges.append(f"[{Colors.GREEN}origin{Colors.RESET}]")
+    badges.append(BADGE_FORK if fork else BADGE_ORIGIN)
 
-    if metadata.get("archived"):
-        badges.append(f"[{Colors.BLUE}archived{Colors.RESET}]")
+    if archived:
+        badges.append(BADGE_ARCHIVED)
 
-    if metadata.get("disabled"):
-        badges.append(f"[{Colors.RED}disabled{Colors.RESET}]")
+    if disabled:
+        badges.append(BADGE_DISABLED)
 
     return " ".join(badges)
 
-def get_org_repos(org: str, include_forks: bool = True) -> List[Dict]:
-    repos = []
-    page = 1
-
-    while True:
-        if INTERRUPTED:
-            return repos
+def format_repo_type(metadata: Optional[Dict], failed: bool = False) -> str:
+    if metadata is None:
+        return compose_badges(failed, False, False, False, False, False)
+
+    return compose_badges(
+        failed,
+        True,
+        bool(metadata.get("private")),
+        bool(metadata.get("fork")),
+        bool(metadata.get("archived")),
+        bool(metadata.get("disabled"))
+    )
+
+def _paginate(url_base: str, label: str) -> List[Dict]:
+    items = []
+
+    status_code, data, link = get_listing_page(f"{url_base}&page=1")
+    if status_code != 200:
+        if not SILENT_MODE:
+            print(f"[{Colors.RED}ERR{Colors.RESET}] Failed to fetch {label}: {status_code}")
+        return items
+
+    items.extend(data)
+
+    match = LAST_PAGE_RE.search(link)
+    if match:
+        last_page = int(match.group(1))
+        executor = ThreadPoolExecutor(max_workers=PAGE_WORKERS)
+        pages = executor.map(
+            lambda page: get_listing_page(f"{url_base}&page={page}"),
+            range(2, last_page + 1)
+        )
+        try:
+            for status_code, data, _ in pages:
+                if status_code != 200:
+                    if not SILENT_MODE:
+                        print(f"[{Colors.RED}ERR{Colors.RESET}] Failed to fetch {label}: {status_code}")
+                    break
+                items.extend(data)
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+        if status_code != 200 or len(data) < PAGE_SIZE:
+            return items
+        page = last_page + 1
+    else:
+        page = 2
 
-        url = f"https://api.github.com/orgs/{org}/repos?per_page=100&page={page}"
-        response = requests.get(url, headers=get_headers())
+    while items:
+        status_code, data, _ = get_listing_page(f"{url_base}&page={page}")
 
-        if response.status_code != 200:
+        if status_code != 200:
             if not SILENT_MODE:
-                print(f"[{Colors.RED}ERR{Colors.RESET}] Failed to fetch org repos: {response.status_code}")
+                print(f"[{Colors.RED}ERR{Colors.RESET}] Failed to fetch {label}: {status_code}")
             break
 
-        data = response.json()
         if not data:
             break
 
-        for repo in data:
-            if include_forks or not repo.get("fork", False):
-                repo_info = {
-                    "url": repo["clone_url"],
-                    "fork": repo.get("fork", False),
-                    "private": repo.get("private", False),
-                    "archived": repo.get("archived", False),
-                    "disabled": repo.get("disabled", False)
-                }
-                repos.append(repo_info)
-
-                REPO_METADATA_CACHE[repo["clone_url"]] = {
-                    "fork": repo_info["fork"],
-                    "private": repo_info["private"],
-                    "archived": repo_info["archived"],
-                    "disabled": repo_info["disabled"]
-                }
-
+        items.extend(data)
+        if len(data) < PAGE_SIZE:
+            break
         page += 1
 
-    return repos
-
-def get_org_members(org: str) -> List[str]:
-    members = []
-    page = 1
+    return items
 
-    while True:
-        if INTERRUPTED:
-            return members
+def get_org_repos(org: str, include_forks: bool = True) -> List[Dict]:
+    repos = []
 
-        url = f"https://api.github.com/orgs/{org}/members?per_page=100&page={page}"
-        response = requests.get(url, headers=get_headers())
+    url_base = f"https://api.github.com/orgs/{org}/repos?per_page={PAGE_SIZE}"
+    for repo in _paginate(url_base, "org repos"):
+        if include_forks or not repo.get("fork", False):
+            repo_info = {
+                "url": repo["clone_url"],
+                "fork": repo.get("fork", False),
+                "private": repo.get("private", False),
+                "archived": repo.get("archived", False),
+                "disabled": repo.get("disabled", False)
+            }
+            repos.append(repo_info)
 
-        if response.status_code != 200:
-            if not SILENT_MODE:
-                print(f"[{Colors.RED}ERR{Colors.RESET}] Failed to fetch org members: {response.status_code}")
-            break
+            REPO_METADATA_CACHE[repo["clone_url"]] = {
+                "fork": repo_info["fork"],
+                "private": repo_info["private"],
+                "archived": repo_info["archived"],
+                "disabled": repo_info["disabled"]
+            }
 
-        data = response.json()
-        if not data:
-            break
+    return repos
 
-        for member in data:
-            members.append(member["login"])
+def get_org_members(org: str) -> List[str]:
+    members = {}
 
-        page += 1
+    url_base = f"https://api.github.com/orgs/{org}/members?per_page={PAGE_SIZE}"
+    for member in _paginate(url_base, "org members"):
+        members[member["login"]] = None
 
-    return list(set(members))
+    return list(members)
 
 def get_user_repos(username: str, include_forks: bool = True) -> List[Dict]:
     repos = []
-    page = 1
-
-    while True:
-        if INTERRUPTED:
-            return repos
-
-        url = f"https://api.github.com/users/{username}/repos?per_page=100&page={page}"
-        response = requests.get(url, headers=get_headers())
-
-        if response.status_code != 200:
-            if not SILENT_MODE:
-                print(f"[{Colors.RED}ERR{Colors.RESET}] Failed to fetch repos for {username}: {response.status_code}")
-            break
 
-        data = response.json()
-        if not data:
-            break
-
-        for repo in data:
-            if include_forks or not repo.get("fork", False):
-                repo_info = {
-                    "url": repo["clone_url"],
-                    "fork": repo.get("fork", False),
-                    "private": repo.get("private", False),
-                    "archived": repo.get("archived", False),
-                    "disabled": repo.get("disabled", False)
-                }
-                repos.append(repo_info)
-
-                REPO_METADATA_CACHE[repo["clone_url"]] = {
-                    "fork": repo_info["fork"],
-                    "private": repo_info["private"],
-                    "archived": repo_info["archived"],
-                    "disabled": repo_info["disabled"]
-                }
+    url_base = f"https://api.github.com/users/{username}/repos?per_page={PAGE_SIZE}"
+    for repo in _paginate(url_base, f"repos for {username}"):
+        if include_forks or not repo.get("fork", False):
+            repo_info = {
+                "url": repo["clone_url"],
+                "fork": repo.get("fork", False),
+                "private": repo.get("private", False),
+                "archived": repo.get("archived", False),
+                "disabled": repo.get("disabled", False)
+            }
+            repos.append(repo_info)
 
-        page += 1
+            REPO_METADATA_CACHE[repo["clone_url"]] = {
+                "fork": repo_info["fork"],
+                "private": repo_info["private"],
+                "archived": repo_info["archived"],
+                "disabled": repo_info["disabled"]
+            }
 
     return repos
 
-def scan_with_trufflehog(repo_url: str, idx: int, total: int, output_dir: str = None, only_verified: bool = False):
-    if INTERRUPTED:
+def scan_with_trufflehog(repo_url: str, output_dir: str = None, only_verified: bool = False):
+    global SCANNED_COUNT
+    if INTERRUPTED.is_set():
         return
 
-    repo_name = repo_url.rstrip("/").split("/")[-1].replace(".git", "")
-    org_or_user = repo_url.rstrip("/").split("/")[-2]
+    org_or_user, repo_name = parse_repo_url(repo_url)
+    repo_is_ignored = matches_ignored(repo_url)
     repo_full = f"{org_or_user}/{repo_name}"
 
     metadata = get_repo_metadata(repo_url)
 
-    cmd = ["trufflehog", "git", repo_url, "--json"]
+    cmd = ["trufflehog", "git", repo_url, "--json", "--no-update"]
 
     if only_verified:
         cmd.append("--only-verified")
 
-    result = run_command(cmd)
+    proc = start_process(cmd)
+    if proc is None:
+        return
 
-    padding = len(str(total))
-    progress = f"{Colors.DIM}[{str(idx).zfill(padding)}/{total}]{Colors.RESET}"
-
-    if result["success"]:
-        critical_findings = []
-        medium_findings = []
-        has_any_medium = False
-
-        if result["output"]:
-            findings = [line for line in result["output"].strip().split("\n") if line]
-
-            for finding_line in findings:
-                try:
-                    finding_data = json.loads(finding_line)
-                    if should_label_as_medium(finding_data):
-                        medium_findings.append(finding_line)
-                        has_any_medium = True
-                    else:
-                        critical_findings.append(finding_line)
-                except json.JSONDecodeError:
-                    critical_findings.append(finding_line)
-
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-                if critical_findings:
-                    output_file = os.path.join(output_dir, f"{org_or_user}_{repo_name}_critical.json")
-                    with open(output_file, "w") as f:
-                        f.write("\n".join(critical_findings))
-                if medium_findings:
-                    output_file = os.path.join(output_dir, f"{org_or_user}_{repo_name}_medium.json")
-                    with open(output_file, "w") as f:
-                        f.write("\n".join(medium_findings))
-
-        critical_count = len(critical_findings)
-        medium_count = len(medium_findings)
-        total_findings = critical_count + medium_count
+    counts = {"critical": 0, "medium": 0}
+    output_files = {}
+
+    try:
+        with proc:
+            for finding_line in proc.stdout:
+                finding_line = finding_line.strip()
+                if not finding_line:
+                    continue
+                if repo_is_ignored:
+                    severity = "medium"
+                else:
+                    try:
+                        severity = "medium" if should_label_as_medium(json_loads(finding_line)) else "critical"
+                    except ValueError:
+                        severity = "critical"
+
+                counts[severity] += 1
+
+                if output_dir:
+                    output_file = output_files.get(severity)
+                    if output_file is None:
+                        output_file = open(os.path.join(output_dir, f"{org_or_user}_{repo_name}_{severity}.json"), "wb")
+                        output_files[severity] = output_file
+                    output_file.write(finding_line + b"\n")
+    finally:
+        finish_process(proc)
+        for output_file in output_files.values():
+            output_file.close()
+
+    if proc.returncode == 0:
+        total_findings = counts["critical"] + counts["medium"]
 
         repo_type = format_repo_type(metadata, failed=False)
 
         if total_findings > 0:
-            if has_any_medium:
-                count_color = Colors.ORANGE
-            else:
-                count_color = Colors.RED
-            count = f"[{count_color}{total_findings} findings{Colors.RESET}]"
-            if not SILENT_MODE or critical_count > 0 or medium_count > 0:
-                print(f"{progress} {repo_type} {repo_full} {count}")
+            count_tmpl = COUNT_MEDIUM_TMPL if counts["medium"] else COUNT_CRITICAL_TMPL
+            count = count_tmpl % total_findings
+            line = f"{repo_type} {repo_full} {count}"
+        elif not SILENT_MODE:
+            line = f"{repo_type} {repo_full}"
         else:
-            if not SILENT_MODE:
-                print(f"{progress} {repo_type} {repo_full}")
+            line = None
     else:
         repo_type = format_repo_type(metadata, failed=True)
-        print(f"{progress} {repo_type} {repo_full}")
+        line = f"{repo_type} {repo_full}"
+
+    with OUTPUT_LOCK:
+        if INTERRUPTED.is_set():
+            return
+        SCANNED_COUNT += 1
+        if line is not None:
+            emit(f"{PROGRESS_TMPL % SCANNED_COUNT} {line}")
 
 def main():
-    global SILENT_MODE, START_TIME, OLD_TERM_SETTINGS
+    global SILENT_MODE, START_TIME, OLD_TERM_SETTINGS, PROGRESS_TMPL
 
     try:
         OLD_TERM_SETTINGS = termios.tcgetattr(sys.stdin)
         new_settings = termios.tcgetattr(sys.stdin)
         new_settings[3] = new_settings[3] & ~termios.ECHOCTL
         termios.tcsetattr(sys.stdin, termios.TCSADRAIN, new_settings)
-    except:
+    except Exception:
         pass
 
     parser = argparse.ArgumentParser(description="Fetch Git URLs and scan with TruffleHog")
@@ -378,10 +590,13 @@ def main():
     parser.add_argument("-user", help="GitHub username")
     parser.add_argument("-repo", help="Single repository URL")
     parser.add_argument("-include-forks", action="store_true", help="Include forked repositories")
+    parser.add_argument("-include-archived", action="store_true", help="Include archived repositories")
+    parser.add_argument("-include-disabled", action="store_true", help="Include disabled repositories")
     parser.add_argument("-include-members", action="store_true", help="Include organization member repositories (only with -org)")
     parser.add_argument("-output", help="Directory to save TruffleHog results")
     parser.add_argument("-results", choices=["valid", "all"], default="all", help="Filter results: 'valid' for verified secrets only, 'all' for everything")
     parser.add_argument("-silent", action="store_true", help="Only print scan results")
+    parser.add_argument("-jobs", type=int, default=min(32, (os.cpu_count() or 1) * 4), help="Number of repositories to scan in parallel")
 
     args = parser.parse_args()
 
@@ -399,6 +614,9 @@ def main():
 
     only_verified = args.results == "valid"
 
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+
     all_repos: Dict[str, Dict] = {}
 
     if args.repo:
@@ -420,14 +638,19 @@ def main():
             if not SILENT_MODE:
                 print(f"[{Colors.CYAN}INF{Colors.RESET}] Found {Colors.BOLD}{len(members)}{Colors.RESET} organization members")
 
-            for member in members:
-                if INTERRUPTED:
-                    break
-                member_repos = get_user_repos(member, args.include_forks)
-                if member_repos and not SILENT_MODE:
-                    print(f"{Colors.DIM}[*]{Colors.RESET} {member}: {len(member_repos)} repositories")
-                for repo_info in member_repos:
-                    all_repos[repo_info["url"]] = repo_info
+            executor = ThreadPoolExecutor(max_workers=MEMBER_WORKERS)
+            member_results = executor.map(lambda member: get_user_repos(member, args.include_forks), members)
+            try:
+                for member, member_repos in zip(members, member_results):
+                    if member_repos and not SILENT_MODE:
+                        emit(f"{Colors.DIM}[*]{Colors.RESET} {member}: {len(member_repos)} repositories")
+                    for repo_info in member_repos:
+                        all_repos[repo_info["url"]] = repo_info
+            except KeyboardInterrupt:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown()
+            flush_output()
 
     if args.user:
         if not SILENT_MODE:
@@ -438,24 +661,61 @@ def main():
         for repo_info in user_repos:
             all_repos[repo_info["url"]] = repo_info
 
-    if INTERRUPTED:
-        sys.exit(130)
+    unique_repos: Dict[Tuple[str, str], str] = {}
+    for repo_url in sorted(all_repos):
+        owner, repo_name = parse_repo_url(repo_url)
+        unique_repos.setdefault((owner.lower(), repo_name.lower()), repo_url)
+
+    all_repos_list = sorted(unique_repos.values())
+
+    prefetch_repo_metadata(all_repos_list)
+
+    if INTERRUPTED.is_set():
+        raise KeyboardInterrupt
+
+    skipped_count = 0
+    if not args.include_archived or not args.include_disabled:
+        scan_list = []
+        for repo_url in all_repos_list:
+            metadata = REPO_METADATA_CACHE.get(repo_url, {})
+            if (metadata.get("archived") and not args.include_archived) or (metadata.get("disabled") and not args.include_disabled):
+                skipped_count += 1
+            else:
+                scan_list.append(repo_url)
+        all_repos_list = scan_list
 
-    all_repos_list = sorted(list(all_repos.keys()))
+    if skipped_count and not SILENT_MODE:
+        print(f"[{Colors.CYAN}INF{Colors.RESET}] Skipped {Colors.BOLD}{skipped_count}{Colors.RESET} archived or disabled repositories")
 
     if not SILENT_MODE:
         print(f"[{Colors.CYAN}INF{Colors.RESET}] Starting scan of {Colors.BOLD}{len(all_repos_list)}{Colors.RESET} repositories")
 
-    START_TIME = time.time()
+    total = len(all_repos_list)
+    padding = len(str(total))
+    PROGRESS_TMPL = f"{Colors.DIM}[%0{padding}d/{total}]{Colors.RESET}"
 
-    for idx, repo_url in enumerate(all_repos_list, 1):
-        if INTERRUPTED:
-            break
-        scan_with_trufflehog(repo_url, idx, len(all_repos_list), args.output, only_verified)
+    START_TIME = time.time()
 
+    executor = ThreadPoolExecutor(max_workers=max(1, args.jobs))
+    futures = [
+        executor.submit(scan_with_trufflehog, repo_url, args.output, only_verified)
+        for repo_url in all_repos_list
+    ]
+    try:
+        for future in as_completed(futures):
+            future.result()
+    except KeyboardInterrupt:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+    flush_output()
     elapsed_time = time.time() - START_TIME
     print(f"\n[{Colors.CYAN}INF{Colors.RESET}] Scan finished {Colors.DIM}({elapsed_time:.3f}s elapsed time){Colors.RESET}")
     cleanup()
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except KeyboardInterrupt:
+        handle_interrupt()